@@ -80,6 +80,10 @@ class TestConfigGenerator(IsolatedAsyncioTestCase):
             },
         )
 
+    def test_sqlite_max_prefetch_concurrency(self):
+        res = expand_db_url("sqlite:///some/test.sqlite?max_prefetch_concurrency=3")
+        self.assertEqual(res["max_prefetch_concurrency"], 3)
+
     def test_sqlite_invalid(self):
         with self.assertRaises(ConfigurationError):
             expand_db_url("sqlite://")
@@ -258,6 +262,10 @@ class TestConfigGenerator(IsolatedAsyncioTestCase):
             },
         )
 
+    def test_mysql_pool_recycle(self):
+        res = expand_db_url("mysql://root:@127.0.0.1:3306/test?pool_recycle=3600")
+        self.assertEqual(res["pool_recycle"], 3600)
+
     def test_generate_config_basic(self):
         res = generate_config(
             db_url="sqlite:///some/test.sqlite",
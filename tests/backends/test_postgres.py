@@ -3,10 +3,11 @@ Test some PostgreSQL-specific features
 """
 import ssl
 
-from tests.testmodels import Tournament
+from tests.testmodels import Tournament, UniqueName
 from tortoise import Tortoise
 from tortoise.contrib import test
-from tortoise.exceptions import OperationalError
+from tortoise.exceptions import IntegrityError, OperationalError
+from tortoise.transactions import in_transaction
 
 
 class TestPostgreSQL(test.TortoiseBaseTestCase):
@@ -79,3 +80,33 @@ class TestPostgreSQL(test.TortoiseBaseTestCase):
 
         except ConnectionError:
             pass
+
+    async def test_bulk_create_copy(self):
+        from tortoise.backends.asyncpg.executor import AsyncpgExecutor
+
+        Tortoise.init(self.db_config)
+        await Tortoise.open_connections(create_db=True)
+        await Tortoise.generate_schemas()
+
+        count = AsyncpgExecutor.COPY_THRESHOLD
+        await UniqueName.bulk_create([UniqueName(name=str(i)) for i in range(count)])
+        res = await UniqueName.all().order_by("id").values_list("name", flat=True)
+        self.assertEqual(res, [str(i) for i in range(count)])
+
+    async def test_bulk_create_copy_in_transaction(self):
+        from tortoise.backends.asyncpg.executor import AsyncpgExecutor
+
+        Tortoise.init(self.db_config)
+        await Tortoise.open_connections(create_db=True)
+        await Tortoise.generate_schemas()
+
+        count = AsyncpgExecutor.COPY_THRESHOLD
+        with self.assertRaises(IntegrityError):
+            async with in_transaction():
+                await UniqueName.bulk_create([UniqueName(name=str(i)) for i in range(count)])
+                await UniqueName.create(name="0")
+        self.assertEqual(await UniqueName.all().count(), 0)
+
+        async with in_transaction():
+            await UniqueName.bulk_create([UniqueName(name=str(i)) for i in range(count)])
+        self.assertEqual(await UniqueName.all().count(), count)
@@ -0,0 +1,17 @@
+"""
+Same tables as models_reinit1, defined by other classes
+"""
+
+from tortoise import fields
+from tortoise.models import Model
+
+
+class Owner(Model):
+    id = fields.IntegerField(primary_key=True)
+    name = fields.TextField()
+
+
+class Thing(Model):
+    id = fields.IntegerField(primary_key=True)
+    name = fields.TextField()
+    owner = fields.ForeignKey("models.Owner", related_name="things")
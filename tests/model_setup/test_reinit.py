@@ -0,0 +1,56 @@
+"""
+Tests for re-initialising with other model classes on the same tables
+"""
+
+from tests.model_setup import models_reinit1, models_reinit2
+from tortoise import Tortoise
+from tortoise.contrib import test
+
+
+class TestReinit(test.TortoiseBaseTestCase):
+
+    tortoise_test_modules = []
+
+    def setUp(self):
+        Tortoise._app_models_map = {}
+        Tortoise._db_client_map = {}
+        Tortoise._inited = False
+        self.engine = self.get_db_config()["connections"]["models"]["engine"]
+        if self.engine != "tortoise.backends.sqlite":
+            raise test.SkipTest("sqlite only")
+
+    async def asyncTearDown(self) -> None:
+        await Tortoise.close_connections()
+        Tortoise._reset()
+
+    async def init_for(self, module: str) -> None:
+        Tortoise.init(
+            {
+                "connections": {
+                    "default": {
+                        "engine": "tortoise.backends.sqlite",
+                        "file_path": ":memory:",
+                    }
+                },
+                "apps": {"models": {"models": [module], "default_connection": "default"}},
+            }
+        )
+        await Tortoise.open_connections()
+        await Tortoise.generate_schemas()
+
+    async def test_reinit_other_classes(self):
+        for models in (models_reinit1, models_reinit2):
+            await self.init_for(models.__name__)
+            owner = await models.Owner.create(name="owner")
+            await models.Thing.create(name="thing", owner=owner)
+
+            thing = await models.Thing.all().prefetch_related("owner").first()
+            self.assertIs(type(thing), models.Thing)
+            self.assertIs(type(thing.owner), models.Owner)
+
+            owner = await models.Owner.all().prefetch_related("things").first()
+            self.assertIs(type(owner), models.Owner)
+            self.assertIs(type(owner.things[0]), models.Thing)
+
+            await Tortoise.close_connections()
+            Tortoise._reset()
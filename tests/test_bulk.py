@@ -1,9 +1,13 @@
 
+import datetime
+from decimal import Decimal
 from uuid import UUID, uuid4
 
-from tests.testmodels import UniqueName, UUIDPkModel
+from tests.testmodels import (
+    DatetimeFields, DecimalFields, UniqueName, UUIDFkRelatedModel, UUIDPkModel,
+)
 from tortoise.contrib import test
-from tortoise.exceptions import IntegrityError
+from tortoise.exceptions import IntegrityError, ParamsError
 from tortoise.transactions import in_transaction
 
 
@@ -28,6 +32,87 @@ class TestBulk(test.TortoiseTestModelsTestCase):
         self.assertEqual(all_,
             [{"id": val, "name": "updated-name-{}".format(val)} for val in range(first, first+100)])
 
+    async def test_bulk_update_over_max_params(self):
+        # Enough rows for the bulk update to be split into several statements
+        count = (UniqueName._meta.db.capabilities.max_params or 1000) // 2 + 1
+        await UniqueName.bulk_create([UniqueName(name=str(i)) for i in range(count)])
+        all_ = await UniqueName.all().order_by("id")
+        for un in all_:
+            un.name = "u" + un.name
+
+        await UniqueName.bulk_update(all_, ["name"])
+        res = await UniqueName.all().order_by("id").values_list("name", flat=True)
+        self.assertEqual(res, ["u" + str(i) for i in range(count)])
+
+    async def test_bulk_update_duplicate_pk(self):
+        await UniqueName.create(name="a")
+        first = await UniqueName.get(name="a")
+        last = await UniqueName.get(name="a")
+        first.name = "first"
+        last.name = "last"
+
+        await UniqueName.bulk_update([first, last], ["name"])
+        self.assertEqual(await UniqueName.all().values_list("name", flat=True), ["last"])
+
+    async def test_bulk_update_field_types(self):
+        now = datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+        decimals = [
+            await DecimalFields.create(decimal=Decimal("1.2345"), decimal_nodec=1) for _ in range(2)
+        ]
+        for obj in decimals:
+            obj.decimal = Decimal("2.5")
+            obj.decimal_null = Decimal("-3.0001")
+        await DecimalFields.bulk_update(decimals, ["decimal", "decimal_null"])
+        self.assertEqual(
+            await DecimalFields.all().values_list("decimal", "decimal_null"),
+            [(Decimal("2.5"), Decimal("-3.0001"))] * 2,
+        )
+
+        datetimes = [await DatetimeFields.create(datetime=now) for _ in range(2)]
+        for obj in datetimes:
+            obj.datetime_null = now
+        await DatetimeFields.bulk_update(datetimes, ["datetime_null"])
+        self.assertEqual(
+            await DatetimeFields.all().values_list("datetime_null", flat=True), [now] * 2
+        )
+
+        parent = await UUIDPkModel.create()
+        children = [await UUIDFkRelatedModel.create(model=parent) for _ in range(2)]
+        for index, obj in enumerate(children):
+            obj.name = str(index)
+        await UUIDFkRelatedModel.bulk_update(children, ["name"])
+        self.assertEqual(
+            sorted(await UUIDFkRelatedModel.all().values_list("id", "name")),
+            sorted((obj.id, obj.name) for obj in children),
+        )
+
+    async def test_bulk_create_over_max_params(self):
+        await UniqueName.bulk_create([UniqueName(name=str(i)) for i in range(2000)])
+        res = await UniqueName.all().order_by("id").values_list("name", flat=True)
+        self.assertEqual(res, [str(i) for i in range(2000)])
+
+    async def test_bulk_create_batch_size(self):
+        await UniqueName.bulk_create([UniqueName(name=str(i)) for i in range(25)], batch_size=10)
+        res = await UniqueName.all().order_by("id").values_list("name", flat=True)
+        self.assertEqual(res, [str(i) for i in range(25)])
+
+    async def test_bulk_create_batch_size_invalid(self):
+        for batch_size in (0, -1):
+            with self.assertRaises(ParamsError):
+                await UniqueName.bulk_create([UniqueName()], batch_size=batch_size)
+        self.assertEqual(await UniqueName.all().count(), 0)
+
+    async def test_bulk_create_using_db_positional(self):
+        await UniqueName.bulk_create([UniqueName(name="a")], UniqueName._meta.db)
+        self.assertEqual(await UniqueName.all().values_list("name", flat=True), ["a"])
+
+    async def test_bulk_create_over_max_params_fail(self):
+        with self.assertRaises(IntegrityError):
+            await UniqueName.bulk_create(
+                [UniqueName(name=str(i)) for i in range(2000)] + [UniqueName(name="0")]
+            )
+        self.assertEqual(await UniqueName.all().count(), 0)
+
     async def test_bulk_create_uuidpk(self):
         await UUIDPkModel.bulk_create([UUIDPkModel() for _ in range(100)])
         res = await UUIDPkModel.all().values_list("id", flat=True)
@@ -111,6 +111,22 @@ class TestPrefetching(test.TortoiseTransactionedTestModelsTestCase):
         with self.assertRaisesRegex(UnknownFieldError, str(UnknownFieldError("tour1nament", Event))):
             await Event.all().prefetch_related("tour1nament").first()
 
+    async def test_fetch_related_repeated(self):
+        tournament = await Tournament.create(name="tournament")
+        event = await Event.create(name="First", tournament=tournament)
+        team = await Team.create(name="1")
+        await event.participants.add(team)
+
+        for _ in range(2):
+            event = await Event.get(id=event.id)
+            await event.fetch_related("participants", "tournament")
+            self.assertEqual(list(event.participants), [team])
+            self.assertEqual(event.tournament.id, tournament.id)
+
+        for _ in range(2):
+            with self.assertRaises(UnknownFieldError):
+                await event.fetch_related("tour1nament")
+
     async def test_prefetch_m2m_filter(self):
         tournament = await Tournament.create(name="tournament")
         team = await Team.create(name="1")
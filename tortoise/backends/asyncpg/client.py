@@ -1,6 +1,6 @@
 
 import asyncio
-from typing import Optional, SupportsInt, Tuple, Sequence, Any, List
+from typing import Optional, SupportsInt, Tuple, Sequence, Any, Iterable, List
 
 import asyncpg
 from asyncpg.transaction import Transaction
@@ -47,7 +47,7 @@ class AsyncpgDBClient(BaseDBAsyncClient):
     filter_class = AsyncpgFilter
     executor_class = AsyncpgExecutor
     schema_generator = AsyncpgSchemaGenerator
-    capabilities = Capabilities("postgres")
+    capabilities = Capabilities("postgres", max_params=32767)
 
     def __init__(
         self, user: str, password: str, database: str, host: str, port: SupportsInt, **kwargs
@@ -64,8 +64,10 @@ class AsyncpgDBClient(BaseDBAsyncClient):
         self.extra.pop("connection_name", None)
         self.extra.pop("loop", None)
         self.extra.pop("connection_class", None)
+        self.extra.pop("max_prefetch_concurrency", None)
         self.pool_minsize = int(self.extra.pop("minsize", 1))
         self.pool_maxsize = int(self.extra.pop("maxsize", 5))
+        self.max_prefetch_concurrency = self.max_prefetch_concurrency or self.pool_maxsize
 
         self._pool: Optional[asyncpg.pool] = None
 
@@ -158,6 +160,15 @@ class AsyncpgDBClient(BaseDBAsyncClient):
             else:
                 await transaction.commit()
 
+    @translate_pg_exceptions
+    async def execute_copy(self, table: str, columns: List[str], values: Iterable[list]) -> None:
+        # values may be a generator, so it is streamed to the server rather than logged
+        async with self.acquire_connection() as connection:
+            self.log.debug("COPY %s (%s)", table, ", ".join(columns))
+            await connection.copy_records_to_table(
+                table, records=values, columns=columns, schema_name=self.schema
+            )
+
     @translate_pg_exceptions
     async def execute_query(
         self, query: str, values: Optional[list] = None
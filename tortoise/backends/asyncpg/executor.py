@@ -1,15 +1,25 @@
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence
 
 import asyncpg
 from pypika import Parameter
 
-from tortoise.backends.base.executor import BaseExecutor
+from tortoise.backends.base.executor import MULTIROW_CACHE_SIZE, BaseExecutor
 from tortoise.models import Model
 
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.backends.asyncpg.client import AsyncpgDBClient
+
 
 class AsyncpgExecutor(BaseExecutor):
+    __slots__ = ()
+
+    db: "AsyncpgDBClient"
+
     EXPLAIN_PREFIX = "EXPLAIN (FORMAT JSON, VERBOSE)"
+    # Bulk inserts of at least this many rows are sent with COPY,
+    # smaller ones as multi-row INSERT statements
+    COPY_THRESHOLD = 100
 
     def parameter(self, pos: int) -> Parameter:
         return Parameter("$%d" % (pos + 1,))
@@ -30,3 +40,81 @@ class AsyncpgExecutor(BaseExecutor):
             col_to_field_name = instance._meta.db_column_to_field_name_map
             for column_name, val in zip(self.model._meta.generated_column_names, results):
                 setattr(instance, col_to_field_name[column_name], val)
+
+    async def _execute_bulk_insert(
+        self, instances: List[Model], batch_size: Optional[int] = None
+    ) -> None:
+        # COPY streams the rows, so batch_size only applies to the multi-row INSERT path
+        if len(instances) >= self.COPY_THRESHOLD:
+            get_values = self.plan.get_insert_values
+            await self.db.execute_copy(
+                self.model._meta.db_table,
+                [field_object.db_column for field_object in self.plan.insert_fields],
+                (get_values(instance) for instance in instances),
+            )
+        else:
+            await super()._execute_bulk_insert(instances, batch_size)
+
+    def _prepare_bulk_update_statement(self, update_fields: Sequence[str], row_count: int) -> str:
+        """
+        Generates the SQL for updating row_count rows with a single
+        UPDATE ... FROM (VALUES ...) statement, matching the values order of _get_update_statement.
+        Result is cached for performance.
+        """
+        key = (tuple(update_fields), row_count)
+        if key in self.plan.bulk_update_cache:
+            return self.plan.bulk_update_cache[key]
+
+        meta = self.model._meta
+        fields_map = meta.fields_map
+        field_objects = [
+            fields_map[field_name]
+            for field_name in update_fields
+            if not fields_map[field_name].primary_key
+        ]
+        field_objects.append(meta.pk)
+
+        # Parameters in VALUES are untyped, so cast them to the column types.
+        # Length modifiers are left out, so that overlong values fail on assignment
+        # just as with a plain UPDATE, instead of being truncated by the cast.
+        casts = [
+            "::" + field_object.get_for_dialect("SQL_TYPE").partition("(")[0]
+            for field_object in field_objects
+        ]
+        rows = self._get_multirow_values_sql(row_count, len(field_objects), casts)
+
+        sql = self.plan.bulk_update_cache[key] = (
+            'UPDATE "{table}" SET {assignments} FROM (VALUES {rows}) AS "_v"({columns}) '
+            'WHERE "{table}"."{pk}"="_v"."{pk}"'.format(
+                table=meta.db_table,
+                assignments=",".join(
+                    '"{0}"="_v"."{0}"'.format(field_object.db_column)
+                    for field_object in field_objects[:-1]
+                ),
+                rows=rows,
+                columns=",".join('"%s"' % field_object.db_column for field_object in field_objects),
+                pk=meta.pk_db_column,
+            )
+        )
+        if len(self.plan.bulk_update_cache) > MULTIROW_CACHE_SIZE:
+            self.plan.bulk_update_cache.popitem(last=False)
+
+        return sql
+
+    async def _execute_bulk_update(
+        self, instances: Iterable[Model], update_fields: List[str]
+    ) -> None:
+        # Rows joined by UPDATE ... FROM apply in no particular order, so keep only
+        # the last instance per pk, as it is the one executemany would leave behind
+        instances = list({instance.pk: instance for instance in instances}.values())
+        if not instances:
+            return
+
+        _, get_values = self._get_update_statement(update_fields)
+        column_count = len(get_values(instances[0]))
+        await self._execute_multirow(
+            instances,
+            max(1, self.db.capabilities.max_params // column_count),
+            lambda row_count: self._prepare_bulk_update_statement(update_fields, row_count),
+            get_values,
+        )
@@ -1,7 +1,12 @@
 
 from typing import List
 
-from tortoise.backends.base.schema_generator import BaseSchemaGenerator
+from tortoise.backends.base import schema_generator
+from tortoise.backends.base.schema_generator import BaseSchemaGenerator, compile_escape_pattern
+
+# PostgreSQL escapes single quotes by doubling them
+ESCAPE_TRANSLATION_TABLE = {**schema_generator.ESCAPE_TRANSLATION_TABLE, ord("'"): "''"}
+ESCAPE_PATTERN = compile_escape_pattern(ESCAPE_TRANSLATION_TABLE)
 
 
 class AsyncpgSchemaGenerator(BaseSchemaGenerator):
@@ -15,9 +20,9 @@ class AsyncpgSchemaGenerator(BaseSchemaGenerator):
         self.comments_array: List[str] = []
 
     def _escape_comment(self, comment: str) -> str:
-        table = BaseSchemaGenerator._get_escape_translation_table()
-        table[ord("'")] = "''"
-        return comment.translate(table)
+        if not ESCAPE_PATTERN.search(comment):
+            return comment
+        return comment.translate(ESCAPE_TRANSLATION_TABLE)
 
     def _table_comment_generator(self, table: str, comment: str) -> str:
         comment = self.TABLE_COMMENT_TEMPLATE.format(
@@ -36,6 +36,10 @@ class Capabilities:
         and not as a separate statement.
     ``supports_transactions``:
         Indicates that this DB supports transactions.
+    ``max_params``:
+        Maximum number of bound parameters in a single statement,
+        used to batch bulk inserts into multi-row ``INSERT`` statements.
+        ``None`` disables such batching.
     """
 
     def __init__(
@@ -48,6 +52,8 @@ class Capabilities:
         requires_limit: bool = False,
         inline_comment: bool = False,
         supports_transactions: bool = True,
+        # Limits:
+        max_params: Optional[int] = None,
     ) -> None:
         super().__setattr__("_mutable", True)
 
@@ -56,11 +62,13 @@ class Capabilities:
         self.requires_limit = requires_limit
         self.inline_comment = inline_comment
         self.supports_transactions = supports_transactions
+        self.max_params = max_params
 
         super().__setattr__("_mutable", False)
 
     def __setattr__(self, attr, value):
-        if not getattr(self, "_mutable", False):
+        # _mutable is always set first thing in __init__, so it can be read directly
+        if not self._mutable:
             raise AttributeError(attr)
         return super().__setattr__(attr, value)
 
@@ -100,11 +108,16 @@ class BaseDBAsyncClient:
     schema_generator: Type[BaseSchemaGenerator] = BaseSchemaGenerator
     capabilities: Capabilities = Capabilities("sql")
 
-    def __init__(self, connection_name: str, **kwargs) -> None:
+    def __init__(
+        self, connection_name: str, max_prefetch_concurrency: Optional[int] = None, **kwargs
+    ) -> None:
         self.connection_name = connection_name
+        self.max_prefetch_concurrency: Optional[int] = \
+            int(max_prefetch_concurrency) if max_prefetch_concurrency else None
 
     def _copy(self: DBCLIENT, base: DBCLIENT) -> None:
         self.connection_name = base.connection_name
+        self.max_prefetch_concurrency = base.max_prefetch_concurrency
 
     async def create_connection(self, with_db: bool) -> None:
         raise NotImplementedError()  # pragma: nocoverage
@@ -30,6 +30,7 @@ DB_LOOKUP: Dict[str, Dict[str, Any]] = {
             "max_cached_statement_lifetime": int,
             "max_cacheable_statement_size": int,
             "ssl": bool,
+            "max_prefetch_concurrency": int,
         },
     },
     "sqlite": {
@@ -37,7 +38,7 @@ DB_LOOKUP: Dict[str, Dict[str, Any]] = {
         "skip_first_char": False,
         "vmap": {"path": "file_path"},
         "defaults": {"journal_mode": "WAL", "journal_size_limit": 16384},
-        "cast": {"journal_size_limit": int},
+        "cast": {"journal_size_limit": int, "max_prefetch_concurrency": int},
     },
     "mysql": {
         "engine": "tortoise.backends.mysql",
@@ -56,6 +57,8 @@ DB_LOOKUP: Dict[str, Dict[str, Any]] = {
             "echo": bool,
             "no_delay": bool,
             "use_unicode": bool,
+            "pool_recycle": int,
+            "max_prefetch_concurrency": int,
         },
     },
 }
@@ -1,7 +1,12 @@
 
 import asyncio
+from collections import OrderedDict
+from keyword import iskeyword
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Set, Iterable
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple, Type, Set,
+    Iterable,
+)
 from pypika import Parameter
 
 from tortoise.constants import LOOKUP_SEP
@@ -14,13 +19,87 @@ if TYPE_CHECKING:  # pragma: nocoverage
     from tortoise.query.queryset import QuerySet
 
 
-EXECUTOR_CACHE: Dict[
-    str, Tuple[list, str, list, str, str, Dict[str, str]]
-] = {}
+class ExecutorPlan:
+    """
+    Prepared queries and value getters of a model, shared by all its executors
+    on the same connection.
+    """
+    __slots__ = (
+        "model",
+        "insert_fields",
+        "get_insert_values",
+        "insert_query",
+        "insert_fields_all",
+        "get_insert_values_all",
+        "insert_query_all",
+        "delete_query",
+        "pk_db_value",
+        "update_cache",
+        "prefetch_map_cache",
+        "row_factory_cache",
+        "multirow_insert_cache",
+        "bulk_update_cache",
+    )
+
+    def __init__(
+        self,
+        model: Type["Model"],
+        insert_fields: List[Field],
+        get_insert_values: Callable[["Model"], list],
+        insert_query: str,
+        insert_fields_all: List[Field],
+        get_insert_values_all: Callable[["Model"], list],
+        insert_query_all: str,
+        delete_query: str,
+        pk_db_value: Callable,
+    ) -> None:
+        # Row factories and prefetch querysets refer to the model classes,
+        # so a plan is only valid for the class it was built for
+        self.model = model
+        self.insert_fields = insert_fields
+        self.get_insert_values = get_insert_values
+        self.insert_query = insert_query
+        self.insert_fields_all = insert_fields_all
+        self.get_insert_values_all = get_insert_values_all
+        self.insert_query_all = insert_query_all
+        self.delete_query = delete_query
+        self.pk_db_value = pk_db_value
+        # Keyed by the update_fields tuple, the non-pk field names tuple, or None for all fields
+        self.update_cache: Dict[
+            Optional[Tuple[str, ...]], Tuple[str, Callable[["Model"], list]]
+        ] = {}
+        self.prefetch_map_cache: Dict[Tuple[str, ...], Dict[str, FrozenSet[str]]] = {}
+        self.row_factory_cache: Dict[Tuple[tuple, tuple, tuple], Callable] = {}
+        # Multi-row statements per row count, evicted after MULTIROW_CACHE_SIZE entries
+        self.multirow_insert_cache: "OrderedDict[int, str]" = OrderedDict()
+        self.bulk_update_cache: "OrderedDict[Tuple[Tuple[str, ...], int], str]" = OrderedDict()
+
+
+#
+# Per (connection_name, db_table) cache of the executor plans,
+# evicting the least recently used entry once it grows over EXECUTOR_CACHE_SIZE
+#
+EXECUTOR_CACHE_SIZE = 1024
+# Number of distinct row counts kept per model for multi-row statements,
+# as those grow with the number of rows
+MULTIROW_CACHE_SIZE = 16
+EXECUTOR_CACHE: "OrderedDict[Tuple[str, str], ExecutorPlan]" = OrderedDict()
 
 
 class BaseExecutor:
+    # Executors are created per query, so keep them cheap: the per-model state lives in the plan
+    __slots__ = (
+        "model",
+        "db",
+        "_prefetch_map",
+        "_prefetch_queries",
+        "_select_related",
+        "_has_prefetches",
+        "plan",
+    )
+
     EXPLAIN_PREFIX: str = "EXPLAIN"
+    PREFETCH_CONCURRENCY: int = 10
 
     def __init__(
         self,
@@ -36,49 +115,55 @@ class BaseExecutor:
         self._prefetch_map: Dict[str, Set[str]] = prefetch_map or {}
         self._prefetch_queries: Dict[str, 'QuerySet'] = prefetch_queries or {}
         self._select_related: Dict[str, Dict] = select_related or {}
+        # Kept in sync with _prefetch_map and _prefetch_queries, checked on every select
+        self._has_prefetches = bool(self._prefetch_map or self._prefetch_queries)
 
-        key = f"{self.db.connection_name}:{self.model._meta.db_table}"
-        if key in EXECUTOR_CACHE:
-            (
-                self.insert_fields,
-                self.insert_query,
-                self.insert_fields_all,
-                self.insert_query_all,
-                self.delete_query,
-                self.update_cache,
-            ) = EXECUTOR_CACHE[key]
+        key = (self.db.connection_name, self.model._meta.db_table)
+        plan = EXECUTOR_CACHE.get(key)
+        if plan is not None and plan.model is model:
+            EXECUTOR_CACHE.move_to_end(key)
 
         else:
-            self.insert_fields, column_names = self._get_insert_fields_columns()
-            self.insert_query = self._prepare_insert_statement(column_names)
+            plan = EXECUTOR_CACHE[key] = self._build_plan()
+            if len(EXECUTOR_CACHE) > EXECUTOR_CACHE_SIZE:
+                EXECUTOR_CACHE.popitem(last=False)
 
-            if self.model._meta.generated_column_names:
-                self.insert_fields_all, all_column_names = \
-                    self._get_insert_fields_columns(include_generated=True)
-                self.insert_query_all = \
-                    self._prepare_insert_statement(all_column_names)
+        self.plan: ExecutorPlan = plan
 
-            else:
-                self.insert_fields_all = self.insert_fields
-                self.insert_query_all = self.insert_query
-
-            table = self.model._meta.table()
-            self.delete_query = str(
-                db.query_class.from_(table)
-                    .where(table[self.model._meta.pk_db_column] == self.parameter(0))
-                    .delete()
-            )
+    def _build_plan(self) -> ExecutorPlan:
+        insert_fields, column_names = self._get_insert_fields_columns()
+        get_insert_values = self._compile_values_getter(insert_fields)
+        insert_query = self._prepare_insert_statement(column_names)
 
-            self.update_cache = {}
+        if self.model._meta.generated_column_names:
+            insert_fields_all, all_column_names = \
+                self._get_insert_fields_columns(include_generated=True)
+            get_insert_values_all = self._compile_values_getter(insert_fields_all)
+            insert_query_all = self._prepare_insert_statement(all_column_names)
 
-            EXECUTOR_CACHE[key] = (
-                self.insert_fields,
-                self.insert_query,
-                self.insert_fields_all,
-                self.insert_query_all,
-                self.delete_query,
-                self.update_cache,
-            )
+        else:
+            insert_fields_all = insert_fields
+            get_insert_values_all = get_insert_values
+            insert_query_all = insert_query
+
+        table = self.model._meta.table()
+        delete_query = str(
+            self.db.query_class.from_(table)
+                .where(table[self.model._meta.pk_db_column] == self.parameter(0))
+                .delete()
+        )
+
+        return ExecutorPlan(
+            self.model,
+            insert_fields,
+            get_insert_values,
+            insert_query,
+            insert_fields_all,
+            get_insert_values_all,
+            insert_query_all,
+            delete_query,
+            self.model._meta.pk.get_for_dialect("to_db_value"),
+        )
 
     async def execute_explain(self, query) -> Any:
         sql = " ".join((self.EXPLAIN_PREFIX, str(query)))
@@ -86,30 +171,163 @@ class BaseExecutor:
 
     async def execute_select(self, query, custom_fields: Optional[list] = None) -> list:
         _, db_columns, raw_results = await self.db.execute_query(str(query))
+        if not raw_results:
+            return []
 
-        instance_list = []
-        for row in raw_results:
-            row_iter = iter(zip(db_columns, row))
-            instance = self.model._init_from_db_row(row_iter, self._select_related)
-
-            if custom_fields:
-                for field_name in custom_fields:
-                    db_column, value = next(row_iter)
-                    setattr(instance, field_name, value)
-
-            instance_list.append(instance)
+        make_instance = self._get_row_factory(db_columns, custom_fields or ())
+        instance_list = [make_instance(row) for row in raw_results]
 
         await self._execute_prefetch_queries(instance_list)
         return instance_list
 
+    def _get_row_factory(
+        self, db_columns: List[str], custom_fields: Iterable[str]
+    ) -> Callable[[Any], "Model"]:
+        """
+        Compiles a function that creates a model instance, along with its select_related
+        instances and custom fields, from a positional result row.
+        This follows the same path as Model._init_from_db_row.
+        Result is cached for performance.
+        """
+        key = (
+            tuple(db_columns),
+            self._freeze_related_map(self._select_related),
+            tuple(custom_fields),
+        )
+        if key in self.plan.row_factory_cache:
+            return self.plan.row_factory_cache[key]
+
+        models: List[Type["Model"]] = []
+        converters: List[Callable] = []
+        field_types: List[Any] = []
+        lines = ["def make_instance(row):"]
+
+        def add_model(model: Type["Model"], related_map: Dict[str, Dict], position: int) -> int:
+            meta = model._meta
+            instance_var = "instance_%d" % len(models)
+            models.append(model)
+            lines.append("    %s = models[%d].__new__(models[%d])" % (
+                instance_var, len(models) - 1, len(models) - 1))
+            lines.append("    %s._saved_in_db = True" % instance_var)
+
+            for db_column in db_columns[position:position + len(meta.db_columns)]:
+                field_name = meta.db_column_to_field_name_map[db_column]
+                field_object = meta.fields_map[field_name]
+                converter_index = len(converters)
+                converters.append(field_object.to_python_value)
+                field_types.append(field_object.field_type)
+
+                # Values the driver already returns as the field type skip Field.to_python_value
+                if (
+                    type(field_object).to_python_value is Field.to_python_value
+                    and isinstance(field_object.field_type, type)
+                ):
+                    lines.append("    value = row[%d]" % position)
+                    lines.append(
+                        "    %s.%s = value if value is None or value.__class__ is field_types[%d]"
+                        " else converters[%d](value)"
+                        % (instance_var, field_name, converter_index, converter_index)
+                    )
+
+                else:
+                    lines.append("    %s.%s = converters[%d](row[%d])" % (
+                        instance_var, field_name, converter_index, position))
+
+                position += 1
+
+            for field_name, sub_related in related_map.items():
+                remote_model = meta.fields_map[field_name].remote_model
+                sub_instance_var = "instance_%d" % len(models)
+                position = add_model(remote_model, sub_related, position)
+                lines.append("    %s.%s = %s" % (instance_var, field_name, sub_instance_var))
+
+            return position
+
+        position = add_model(self.model, self._select_related, 0)
+        for index, field_name in enumerate(custom_fields):
+            if field_name.isidentifier() and not iskeyword(field_name):
+                lines.append("    instance_0.%s = row[%d]" % (field_name, position + index))
+            else:
+                lines.append("    setattr(instance_0, custom_fields[%d], row[%d])" % (
+                    index, position + index))
+
+        lines.append("    return instance_0")
+
+        namespace = {
+            "models": tuple(models),
+            "converters": tuple(converters),
+            "field_types": tuple(field_types),
+            "custom_fields": tuple(custom_fields),
+        }
+        exec("\n".join(lines), namespace)  # nosec
+
+        make_instance = self.plan.row_factory_cache[key] = namespace["make_instance"]
+        return make_instance
+
+    @classmethod
+    def _freeze_related_map(cls, related_map: Dict[str, Dict]) -> tuple:
+        return tuple(
+            (field_name, cls._freeze_related_map(sub_related))
+            for field_name, sub_related in related_map.items()
+        )
+
     def _get_insert_fields_columns(self, include_generated=False) -> Tuple[List[Field], List[str]]:
-        fields_columns = [(field, field.db_column)
-            for field in self.model._meta.fields_map.values()
-            if field.has_db_column and (include_generated or not field.generated)
+        fields: List[Field] = []
+        column_names: List[str] = []
+        for field in self.model._meta.fields_map.values():
+            if field.has_db_column and (include_generated or not field.generated):
+                fields.append(field)
+                column_names.append(field.db_column)
+
+        return fields, column_names
+
+    @staticmethod
+    def _compile_values_getter(
+        field_objects: List[Field], pk_field_object: Optional[Field] = None
+    ) -> Callable[["Model"], list]:
+        """
+        Compiles a function that returns the db values of the given fields of an instance,
+        followed by the db value of its primary key when pk_field_object is given.
+        The converters are resolved for the dialect once, rather than by Field.db_value per call.
+        """
+        sources = [
+            (field_object, "instance.%s" % field_object.model_field_name)
+            for field_object in field_objects
         ]
+        if pk_field_object is not None:
+            sources.append((pk_field_object, "instance.pk"))
+
+        converters = []
+        field_types = []
+        lines = ["def get_values(instance):"]
+        for i, (field_object, source) in enumerate(sources):
+            converter = field_object.get_for_dialect("to_db_value")
+            converters.append(converter)
+            field_types.append(field_object.field_type)
+
+            #
+            # Field.to_db_value returns values already of the field type as they are,
+            # so those are passed through without calling it
+            #
+            if (
+                getattr(converter, "__func__", None) is Field.to_db_value
+                and isinstance(field_object.field_type, type)
+            ):
+                lines.append("    value_%d = %s" % (i, source))
+                lines.append(
+                    "    if value_%d is not None and value_%d.__class__ is not field_types[%d]:"
+                    % (i, i, i)
+                )
+                lines.append("        value_%d = converters[%d](value_%d, instance)" % (i, i, i))
+
+            else:
+                lines.append("    value_%d = converters[%d](%s, instance)" % (i, i, source))
 
-        # return fields, column_names
-        return tuple(zip(*fields_columns))
+        lines.append("    return [%s]" % ", ".join("value_%d" % i for i in range(len(sources))))
+
+        namespace = {"converters": tuple(converters), "field_types": tuple(field_types)}
+        exec("\n".join(lines), namespace)  # nosec
+        return namespace["get_values"]
 
     def _prepare_insert_statement(self, columns: List[str]) -> str:
         return self.db.query_class.into(self.model._meta.table())\
@@ -124,140 +342,284 @@ class BaseExecutor:
         raise NotImplementedError()  # pragma: nocoverage
 
     async def execute_insert(self, instance: "Model") -> None:
+        plan = self.plan
         if instance._custom_generated_pk:
-            values = [
-                field_object.db_value(getattr(instance, field_object.model_field_name), instance)
-                for field_object in self.insert_fields_all
-            ]
-            await self.db.execute_insert(self.insert_query_all, values)
+            await self.db.execute_insert(
+                plan.insert_query_all, plan.get_insert_values_all(instance)
+            )
 
         else:
-            values = [
-                field_object.db_value(getattr(instance, field_object.model_field_name), instance)
-                for field_object in self.insert_fields
-            ]
-            insert_result = await self.db.execute_insert(self.insert_query, values)
+            insert_result = await self.db.execute_insert(
+                plan.insert_query, plan.get_insert_values(instance)
+            )
             await self._process_insert_result(instance, insert_result)
 
-    async def execute_bulk_insert(self, instances: Iterable["Model"]) -> None:
-        values_lists = [
-            [
-                field_object.db_value(getattr(instance, field_object.model_field_name), instance)
-                for field_object in self.insert_fields
-            ]
-            for instance in instances
-        ]
-        await self.db.execute_many(self.insert_query, values_lists)
+    def _get_bulk_insert_values(self, instances: Iterable["Model"]) -> List[list]:
+        get_values = self.plan.get_insert_values
+        return [get_values(instance) for instance in instances]
 
-    def _get_update_sql(self, update_fields: List[str]) -> str:
+    def _prepare_multirow_insert_statement(self, row_count: int) -> str:
         """
-        Generates the SQL for updating a model depending on provided update_fields.
+        Generates the SQL for inserting row_count rows with a single statement.
         Result is cached for performance.
         """
-        key = ",".join(update_fields)
-        if key in self.update_cache:
-            return self.update_cache[key]
+        cache = self.plan.multirow_insert_cache
+        if row_count in cache:
+            return cache[row_count]
+
+        column_count = len(self.plan.insert_fields)
+        single_row_sql = self.db.query_class.into(self.model._meta.table())\
+            .columns(*[field_object.db_column for field_object in self.plan.insert_fields])\
+            .insert(*[self.parameter(i) for i in range(column_count)])\
+            .get_sql()
 
-        table = self.model._meta.table()
-        query = self.db.query_class.update(table)
-        count = 0
+        # Only the VALUES list grows with row_count, so it's rendered directly
+        # instead of through a pypika builder holding a Parameter per value
+        sql = cache[row_count] = "%s VALUES %s" % (
+            single_row_sql.rpartition(" VALUES ")[0],
+            self._get_multirow_values_sql(row_count, column_count),
+        )
+        if len(cache) > MULTIROW_CACHE_SIZE:
+            cache.popitem(last=False)
 
-        for field_name in update_fields:
-            field_object = self.model._meta.fields_map[field_name]
-            if not field_object.primary_key:
-                query = query.set(field_object.db_column, self.parameter(count))
-                count += 1
+        return sql
 
-        query = query.where(table[self.model._meta.pk_db_column] == self.parameter(count))
+    def _get_multirow_values_sql(
+        self, row_count: int, column_count: int, casts: Optional[List[str]] = None
+    ) -> str:
+        parameter = self.parameter
+        casts = casts or [""] * column_count
+        return ",".join(
+            "(%s)" % ",".join(
+                parameter(row * column_count + i).get_sql() + cast for i, cast in enumerate(casts)
+            )
+            for row in range(row_count)
+        )
 
-        sql = self.update_cache[key] = query.get_sql()
-        return sql
+    async def execute_bulk_insert(
+        self, instances: Iterable["Model"], batch_size: Optional[int] = None
+    ) -> None:
+        await self._execute_bulk_insert(list(instances), batch_size)
 
-    async def execute_update(self, instance, update_fields: Optional[List[str]]) -> int:
-        model_meta = self.model._meta
+    async def _execute_bulk_insert(
+        self, instances: List["Model"], batch_size: Optional[int] = None
+    ) -> None:
+        max_params = self.db.capabilities.max_params
+        column_count = len(self.plan.insert_fields)
+
+        chunk_size = max(1, max_params // column_count) if max_params and column_count else None
+        if batch_size:
+            chunk_size = min(chunk_size or batch_size, batch_size)
+
+        if not instances or not chunk_size or not column_count:
+            await self.db.execute_many(
+                self.plan.insert_query, self._get_bulk_insert_values(instances)
+            )
+            return
+
+        await self._execute_multirow(
+            instances, chunk_size,
+            self._prepare_multirow_insert_statement, self.plan.get_insert_values,
+        )
+
+    async def _execute_multirow(
+        self,
+        instances: List["Model"],
+        chunk_size: int,
+        get_sql: Callable[[int], str],
+        get_values: Callable[["Model"], list],
+    ) -> None:
+        """
+        Executes the multi-row statements returned by get_sql(row_count) for chunks
+        of at most chunk_size instances, all chunks within a single transaction
+        so that the bulk operation stays atomic.
+        The values are extracted chunk by chunk, to keep at most one chunk of them in memory.
+        """
+        if len(instances) <= chunk_size:
+            await self._execute_multirow_chunk(self.db, instances, get_sql, get_values)
+            return
+
+        async with self.db.in_transaction() as connection:
+            for start in range(0, len(instances), chunk_size):
+                await self._execute_multirow_chunk(
+                    connection, instances[start:start + chunk_size], get_sql, get_values
+                )
+
+    @staticmethod
+    async def _execute_multirow_chunk(
+        connection: "BaseDBAsyncClient",
+        instances: List["Model"],
+        get_sql: Callable[[int], str],
+        get_values: Callable[["Model"], list],
+    ) -> None:
+        await connection.execute_query(
+            get_sql(len(instances)),
+            [value for instance in instances for value in get_values(instance)],
+        )
+
+    def _get_update_statement(
+        self, update_fields: Optional[Iterable[str]]
+    ) -> Tuple[str, Callable[["Model"], list]]:
+        """
+        Generates the SQL for updating a model depending on provided update_fields,
+        together with a function that extracts the matching query values from an instance.
+        All fields are updated when no update_fields are provided.
+        Result is cached for performance.
+        """
+        key = tuple(update_fields) if update_fields else None
+        statement = self.plan.update_cache.get(key)
+        if statement is not None:
+            return statement
+
+        meta = self.model._meta
         if not update_fields:
-            update_fields = model_meta.field_to_db_column_name_map.keys()
+            update_fields = meta.field_to_db_column_name_map.keys()
+
+        #
+        # update_fields that differ only by the primary key, which is never set,
+        # share the statement cached under the tuple of their non-pk field names
+        #
+        fields_map = meta.fields_map
+        field_names = tuple(
+            field_name for field_name in update_fields if not fields_map[field_name].primary_key
+        )
+        statement = self.plan.update_cache.get(field_names)
+        if statement is None:
+            statement = self.plan.update_cache[field_names] = self._make_update_statement(
+                [fields_map[field_name] for field_name in field_names]
+            )
 
-        values = [
-            model_meta.fields_map[field_name].db_value(getattr(instance, field_name), instance)
-            for field_name in update_fields
-            if not model_meta.fields_map[field_name].primary_key
-        ]
+        self.plan.update_cache[key] = statement
+        return statement
+
+    def _make_update_statement(
+        self, field_objects: List[Field]
+    ) -> Tuple[str, Callable[["Model"], list]]:
+        meta = self.model._meta
+        parameter = self.parameter
+        table = meta.table()
+        query = self.db.query_class.update(table)
+
+        for count, field_object in enumerate(field_objects):
+            query = query.set(field_object.db_column, parameter(count))
 
-        values.append(model_meta.pk.db_value(instance.pk, instance))
-        return (await self.db.execute_query(self._get_update_sql(update_fields), values))[0]
+        query = query.where(table[meta.pk_db_column] == parameter(len(field_objects)))
+        get_values = self._compile_values_getter(field_objects, meta.pk)
+        return query.get_sql(), get_values
+
+    async def execute_update(self, instance, update_fields: Optional[List[str]]) -> int:
+        sql, get_values = self._get_update_statement(update_fields)
+        return (await self.db.execute_query(sql, get_values(instance)))[0]
 
     async def execute_bulk_update(self, instances: Iterable["Model"], update_fields: List[str]) -> None:
         if not update_fields:
             raise ParamsError("Update fields must be provided for bulk update")
 
-        model_meta = self.model._meta
-        fields_map = model_meta.fields_map
+        fields_map = self.model._meta.fields_map
         if any(fields_map[field_name].primary_key for field_name in update_fields):
             raise ParamsError("Cannot update primary key")
 
-        values_lists = [
-            [fields_map[field_name].db_value(getattr(instance, field_name), instance)
-                for field_name in update_fields] +
-            [model_meta.pk.db_value(instance.pk, instance)]
-
-            for instance in instances
-        ]
+        await self._execute_bulk_update(instances, update_fields)
 
-        await self.db.execute_many(self._get_update_sql(update_fields), values_lists)
+    async def _execute_bulk_update(
+        self, instances: Iterable["Model"], update_fields: List[str]
+    ) -> None:
+        sql, get_values = self._get_update_statement(update_fields)
+        await self.db.execute_many(sql, [get_values(instance) for instance in instances])
 
     async def execute_delete(self, instance) -> int:
+        plan = self.plan
         return (
             await self.db.execute_query(
-                self.delete_query, [self.model._meta.pk.db_value(instance.pk, instance)]
+                plan.delete_query, [plan.pk_db_value(instance.pk, instance)]
             )
         )[0]
 
     def _make_prefetch_queries(self) -> None:
         fields_map = self.model._meta.fields_map
+        prefetch_queries = self._prefetch_queries
+        db = self.db
 
         for field_name, forwarded_prefetches in self._prefetch_map.items():
-            if field_name in self._prefetch_queries:
-                related_query = self._prefetch_queries.get(field_name)
-            else:
-                relation_field = fields_map[field_name]
-                remote_model = relation_field.remote_model
-                related_query = remote_model.all().using_db(self.db)
+            related_query = prefetch_queries.get(field_name)
+            if related_query is None:
+                related_query = fields_map[field_name].remote_model.all().using_db(db)
 
             if forwarded_prefetches:
                 related_query = related_query.prefetch_related(*forwarded_prefetches)
 
-            self._prefetch_queries[field_name] = related_query
+            prefetch_queries[field_name] = related_query
 
     async def _execute_prefetch_queries(self, instance_list: list) -> list:
-        if instance_list and (self._prefetch_map or self._prefetch_queries):
-            self._make_prefetch_queries()
+        if instance_list and self._has_prefetches:
+            if self._prefetch_map:
+                self._make_prefetch_queries()
+
             fields_map = self.model._meta.fields_map
+            prefetch_queries = self._prefetch_queries
 
-            prefetch_tasks = [
-                fields_map[field_name].prefetch(instance_list, related_query)
-                for field_name, related_query in self._prefetch_queries.items()
-            ]
-            await asyncio.gather(*prefetch_tasks)
+            if len(prefetch_queries) == 1:
+                (field_name, related_query), = prefetch_queries.items()
+                await fields_map[field_name].prefetch(instance_list, related_query)
+
+            else:
+                #
+                # Bound the number of prefetch queries running at the same time
+                # so that models with many relations won't starve the connection pool
+                #
+                concurrency = self.db.max_prefetch_concurrency or self.PREFETCH_CONCURRENCY
+                semaphore = asyncio.Semaphore(concurrency)
+                await asyncio.gather(*[
+                    self._bounded(
+                        semaphore, fields_map[field_name].prefetch(instance_list, related_query)
+                    )
+                    for field_name, related_query in prefetch_queries.items()
+                ])
 
         return instance_list
 
-    async def fetch_for_list(self, instance_list: list, *args) -> list:
-        self._prefetch_map = {}
-        for relation in args:
+    @staticmethod
+    async def _bounded(semaphore: asyncio.Semaphore, task: Awaitable) -> Any:
+        async with semaphore:
+            return await task
+
+    def _get_prefetch_map(self, relations: Tuple[str, ...]) -> Dict[str, FrozenSet[str]]:
+        """
+        Parses and validates the relations passed to fetch_for_list into a prefetch map.
+        Result is cached for performance, as an immutable template.
+        """
+        if relations in self.plan.prefetch_map_cache:
+            return self.plan.prefetch_map_cache[relations]
+
+        fields_map = self.model._meta.fields_map
+        prefetch_map: Dict[str, Set[str]] = {}
+        for relation in relations:
             first_level_field, _, forwarded_prefetch = relation.partition(LOOKUP_SEP)
-            field_object = self.model._meta.fields_map.get(first_level_field)
+            field_object = fields_map.get(first_level_field)
             if not field_object:
                 raise UnknownFieldError(first_level_field, self.model)
 
             if field_object.has_db_column:
                 raise NotARelationFieldError(first_level_field, self.model)
 
-            if first_level_field not in self._prefetch_map.keys():
-                self._prefetch_map[first_level_field] = set()
+            if first_level_field not in prefetch_map.keys():
+                prefetch_map[first_level_field] = set()
 
             if forwarded_prefetch:
-                self._prefetch_map[first_level_field].add(forwarded_prefetch)
+                prefetch_map[first_level_field].add(forwarded_prefetch)
+
+        frozen_prefetch_map = self.plan.prefetch_map_cache[relations] = {
+            field_name: frozenset(forwarded_prefetches)
+            for field_name, forwarded_prefetches in prefetch_map.items()
+        }
+        return frozen_prefetch_map
+
+    async def fetch_for_list(self, instance_list: list, *args) -> list:
+        self._prefetch_map = {
+            field_name: set(forwarded_prefetches)
+            for field_name, forwarded_prefetches in self._get_prefetch_map(args).items()
+        }
+        self._has_prefetches = bool(self._prefetch_map or self._prefetch_queries)
 
         await self._execute_prefetch_queries(instance_list)
         return instance_list
@@ -27,7 +27,8 @@ def string_encoder(value, *args):
 
 def list_encoder(values, instance, field: Field):
     """Encodes an iterable of a given field into a database-compatible format."""
-    return [field.db_value(element, instance) for element in values]
+    to_db_value = field.get_for_dialect("to_db_value")
+    return [to_db_value(element, instance) for element in values]
 
 #
 # to_db_value functions
@@ -39,7 +40,8 @@ def related_to_db_value_func(field: RelationField):
 
 
 def list_pk_encoder(values, instance, field: Field):
-    return [field.db_value(getattr(v, "pk", v), instance) for v in values]
+    to_db_value = field.get_for_dialect("to_db_value")
+    return [to_db_value(getattr(v, "pk", v), instance) for v in values]
 
 
 def related_list_to_db_values_func(field: RelationField):
@@ -144,14 +146,12 @@ class BaseFilter:
     @classmethod
     def get_filter_func_for(cls, field: Field, comparison: str) -> Optional[Tuple[Callable, Optional[Callable]]]:
         if isinstance(field, (BackwardFKField, ManyToManyField)):
-            if comparison not in cls.RELATED_FILTER_FUNC_MAP:
+            related_filter = cls.RELATED_FILTER_FUNC_MAP.get(comparison)
+            if related_filter is None:
                 return None
 
-            (filter_operator, filter_encoder) = cls.RELATED_FILTER_FUNC_MAP[comparison]
+            (filter_operator, filter_encoder) = related_filter
             return filter_operator, filter_encoder(field)
 
         else:
-            if comparison not in cls.FILTER_FUNC_MAP:
-                return None
-
-            return cls.FILTER_FUNC_MAP[comparison]
+            return cls.FILTER_FUNC_MAP.get(comparison)
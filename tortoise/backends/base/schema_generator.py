@@ -1,7 +1,36 @@
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from hashlib import sha256
-from typing import List, Set
+from typing import Dict, List, Pattern, Set
+
+from tortoise.fields import ManyToManyField
+
+#
+# Escape sequences taken based on definition provided by PostgreSQL and MySQL,
+# built once for str.translate
+#
+ESCAPE_TRANSLATION_TABLE = str.maketrans({
+    "\0": "\\0",
+    "\\": "\\\\",
+    "\n": "\\n",
+    "\r": "\\r",
+    "\032": "\\Z",
+    '"': '\\"',
+    "'": "\\'",
+})
+
+
+def compile_escape_pattern(translation_table: Dict[int, str]) -> Pattern:
+    """
+    Compiles a pattern matching any character of the translation table.
+    Most comments need no escaping, which a search tells faster than a translate.
+    """
+    return re.compile("[%s]" % re.escape("".join(map(chr, translation_table))))
+
+
+ESCAPE_PATTERN = compile_escape_pattern(ESCAPE_TRANSLATION_TABLE)
 
 
 @dataclass
@@ -37,6 +66,12 @@ class BaseSchemaGenerator:
     def __init__(self, client) -> None:
         self.client = client
 
+        # FK constraint names are only hashed when they end up in the generated SQL
+        self._fk_needs_name = (
+            type(self)._create_fk_string is not BaseSchemaGenerator._create_fk_string
+            or "{constraint_name}" in self.FK_TEMPLATE
+        )
+
     def _create_column_string(
         self, db_column: str, column_type: str, nullable: str, unique: str, is_primary_key: bool, comment: str
     ) -> str:
@@ -80,24 +115,13 @@ class BaseSchemaGenerator:
         # by default does nothing. If need be, it can be over-written
         return ""
 
-    @staticmethod
-    def _get_escape_translation_table() -> List[str]:
-        """escape sequence taken based on definition provided by PostgreSQL and MySQL"""
-        _escape_table = [chr(x) for x in range(128)]
-        _escape_table[0] = "\\0"
-        _escape_table[ord("\\")] = "\\\\"
-        _escape_table[ord("\n")] = "\\n"
-        _escape_table[ord("\r")] = "\\r"
-        _escape_table[ord("\032")] = "\\Z"
-        _escape_table[ord('"')] = '\\"'
-        _escape_table[ord("'")] = "\\'"
-        return _escape_table
-
     def _escape_comment(self, comment: str) -> str:
         # This method provides a default method to escape comment strings as per
         # default standard as applied under mysql like database. This can be
         # overwritten if required to match the database specific escaping.
-        return comment.translate(BaseSchemaGenerator._get_escape_translation_table())
+        if not ESCAPE_PATTERN.search(comment):
+            return comment
+        return comment.translate(ESCAPE_TRANSLATION_TABLE)
 
     def _table_generate_extra(self, table: str) -> str:
         return ""
@@ -109,8 +133,10 @@ class BaseSchemaGenerator:
         return f'"{val}"'
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _make_hash(*args: str, length: int) -> str:
         # Hash a set of string values and get a digest of the given length.
+        # The same table and column names recur across generated schemas, so digests are cached.
         return sha256(";".join(args).encode("utf-8")).hexdigest()[:length]
 
     def _generate_index_name(self, prefix, model, column_names: List[str]) -> str:
@@ -142,26 +168,35 @@ class BaseSchemaGenerator:
             exists="IF NOT EXISTS " if safe else "",
             index_name=self._generate_index_name("idx", model, column_names),
             table_name=model._meta.db_table,
-            columns=", ".join([self.quote(f) for f in column_names]),
+            columns=", ".join(map(self.quote, column_names)),
         )
 
     def _get_unique_constraint_sql(self, model, column_names: List[str]) -> str:
         return self.UNIQUE_CONSTRAINT_CREATE_TEMPLATE.format(
             index_name=self._generate_index_name("uid", model, column_names),
-            columns=", ".join([self.quote(f) for f in column_names]),
+            columns=", ".join(map(self.quote, column_names)),
         )
 
     def get_table_sql_list(self, model, safe=True) -> List[TableCreationData]:
         columns_to_create = []
-        columns_with_index = []
+        # Indexes, deduplicated in order by the dict keys.
+        _indexes: Dict[str, None] = {}
         references = set()
 
-        for field_name, column_name in model._meta.field_to_db_column_name_map.items():
-            field_object = model._meta.fields_map[field_name]
+        meta = model._meta
+        db_table = meta.db_table
+        fields_map = meta.fields_map
+
+        for field_name, column_name in meta.field_to_db_column_name_map.items():
+            field_object = fields_map[field_name]
+            reference = field_object.reference
+
+            # Reference columns are commented with the description of their relation field
+            description = reference.description if reference else field_object.description
             comment = (
                 self._column_comment_generator(
-                    table=model._meta.db_table, column=column_name, comment=field_object.description)
-                if field_object.description
+                    table=db_table, column=column_name, comment=description)
+                if description
                 else ""
             )
 
@@ -180,16 +215,8 @@ class BaseSchemaGenerator:
             nullable = "NOT NULL" if not field_object.null else ""
             unique = "UNIQUE" if field_object.unique else ""
 
-            if field_object.reference:
-                comment = (
-                    self._column_comment_generator(
-                        table=model._meta.db_table,
-                        column=column_name,
-                        comment=field_object.reference.description,
-                    )
-                    if field_object.reference.description
-                    else ""
-                )
+            if reference:
+                remote_meta = reference.remote_model._meta
 
                 field_creation_string = self._create_column_string(
                     db_column=column_name,
@@ -200,19 +227,19 @@ class BaseSchemaGenerator:
                     comment="",
                 ) + self._create_fk_string(
                     constraint_name=self._generate_fk_name(
-                        model._meta.db_table,
+                        db_table,
                         column_name,
-                        field_object.reference.remote_model._meta.db_table,
-                        field_object.reference.remote_model._meta.pk_db_column,
-                    ),
+                        remote_meta.db_table,
+                        remote_meta.pk_db_column,
+                    ) if self._fk_needs_name else "",
                     db_column=column_name,
-                    table=field_object.reference.remote_model._meta.db_table,
-                    related_column=field_object.reference.remote_model._meta.pk_db_column,
-                    on_delete=field_object.reference.on_delete,
+                    table=remote_meta.db_table,
+                    related_column=remote_meta.pk_db_column,
+                    on_delete=reference.on_delete,
                     comment=comment,
                 )
 
-                references.add(field_object.reference.remote_model._meta.db_table)
+                references.add(remote_meta.db_table)
 
             else:
                 field_creation_string = self._create_column_string(
@@ -227,55 +254,50 @@ class BaseSchemaGenerator:
             columns_to_create.append(field_creation_string)
 
             if field_object.db_index and not field_object.primary_key:
-                columns_with_index.append(column_name)
+                _indexes[self._get_index_sql(model, [column_name], safe=safe)] = None
 
-        if model._meta.unique_together:
-            for unique_together_list in model._meta.unique_together:
-                unique_together_to_create = [model._meta.fields_map[field_name].db_column
+        if meta.unique_together:
+            for unique_together_list in meta.unique_together:
+                unique_together_to_create = [fields_map[field_name].db_column
                     for field_name in unique_together_list]
 
                 columns_to_create.append(
                     self._get_unique_constraint_sql(model, unique_together_to_create)
                 )
 
-        # Indexes.
-        _indexes = [
-            self._get_index_sql(model, [column_name], safe=safe) for column_name in columns_with_index
-        ]
-
-        if model._meta.indexes:
-            for indexes_list in model._meta.indexes:
-                indexes_to_create = [model._meta.fields_map[field_name].db_column
+        if meta.indexes:
+            for indexes_list in meta.indexes:
+                indexes_to_create = [fields_map[field_name].db_column
                     for field_name in indexes_list]
 
-                _indexes.append(self._get_index_sql(model, indexes_to_create, safe=safe))
+                _indexes[self._get_index_sql(model, indexes_to_create, safe=safe)] = None
 
-        indexes_create_strings = [val for val in dict.fromkeys(_indexes) if val]
+        indexes_create_strings = [val for val in _indexes if val]
         columns_to_create.extend(self._get_inner_statements())
 
         table_columns_string = "\n    {}\n".format(",\n    ".join(columns_to_create))
         table_comment = (
             self._table_comment_generator(
-                table=model._meta.db_table, comment=model._meta.table_description
+                table=db_table, comment=meta.table_description
             )
-            if model._meta.table_description
+            if meta.table_description
             else ""
         )
 
         table_create_string = self.TABLE_CREATE_TEMPLATE.format(
             exists="IF NOT EXISTS " if safe else "",
-            table_name=model._meta.db_table,
+            table_name=db_table,
             columns=table_columns_string,
             comment=table_comment,
-            extra=self._table_generate_extra(table=model._meta.db_table),
+            extra=self._table_generate_extra(table=db_table),
         )
 
-        table_create_string = "\n".join([table_create_string, *indexes_create_strings])
-        table_create_string += self._post_table_hook()
+        table_create_string = "\n".join([table_create_string, *indexes_create_strings]) \
+            + self._post_table_hook()
 
         output = [
             TableCreationData(
-                db_table=model._meta.db_table,
+                db_table=db_table,
                 primary=True,
                 creation_sql=table_create_string,
                 references=references
@@ -286,34 +308,38 @@ class BaseSchemaGenerator:
         return output
 
     def __get_m2m_table_sql(self, model, safe=True) -> List[TableCreationData]:
-        from tortoise.fields import ManyToManyField
-
+        meta = model._meta
+        backward_type = None
         m2m_data = []
-        for field in model._meta.fields_map.values():
+        for field in meta.fields_map.values():
             if isinstance(field, ManyToManyField) and not field.auto_created:
+                # The backward pk type is shared by every m2m table of the model
+                if backward_type is None:
+                    backward_type = meta.pk.get_for_dialect("SQL_TYPE")
+
+                remote_meta = field.remote_model._meta
                 m2m_create_string = self.M2M_TABLE_TEMPLATE.format(
                     exists="IF NOT EXISTS " if safe else "",
                     table_name=field.through,
-                    backward_table=model._meta.db_table,
-                    forward_table=field.remote_model._meta.db_table,
-                    backward_related_column=model._meta.pk_db_column,
-                    forward_related_column=field.remote_model._meta.pk_db_column,
+                    backward_table=meta.db_table,
+                    forward_table=remote_meta.db_table,
+                    backward_related_column=meta.pk_db_column,
+                    forward_related_column=remote_meta.pk_db_column,
                     backward_key=field.backward_key,
-                    backward_type=model._meta.pk.get_for_dialect("SQL_TYPE"),
+                    backward_type=backward_type,
                     forward_key=field.forward_key,
-                    forward_type=field.remote_model._meta.pk.get_for_dialect("SQL_TYPE"),
+                    forward_type=remote_meta.pk.get_for_dialect("SQL_TYPE"),
                     extra=self._table_generate_extra(table=field.through),
                     comment=
                         self._table_comment_generator(table=field.through, comment=field.description)
                         if field.description else "",
-                )
-                m2m_create_string += self._post_table_hook()
+                ) + self._post_table_hook()
 
                 m2m_data.append(TableCreationData(
                     db_table=field.through,
                     primary=False,
                     creation_sql=m2m_create_string,
-                    references={model._meta.db_table, field.remote_model._meta.db_table},
+                    references={meta.db_table, remote_meta.db_table},
                 ))
 
         return m2m_data
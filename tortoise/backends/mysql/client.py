@@ -49,6 +49,8 @@ class MySQLClient(BaseDBAsyncClient):
     filter_class = MySQLFilter
     executor_class = MySQLExecutor
     schema_generator = MySQLSchemaGenerator
+    # No max_params: parameters are interpolated client side, so the limit is
+    # max_allowed_packet, which executemany already respects when batching rows
     capabilities = Capabilities("mysql", requires_limit=True, inline_comment=True)
 
     def __init__(
@@ -66,10 +68,12 @@ class MySQLClient(BaseDBAsyncClient):
         self.extra.pop("connection_name", None)
         self.extra.pop("db", None)
         self.extra.pop("autocommit", None)
+        self.extra.pop("max_prefetch_concurrency", None)
         self.extra.setdefault("sql_mode", "STRICT_TRANS_TABLES")
         self.charset = self.extra.pop("charset", "utf8mb4")
         self.pool_minsize = int(self.extra.pop("minsize", 1))
         self.pool_maxsize = int(self.extra.pop("maxsize", 5))
+        self.max_prefetch_concurrency = self.max_prefetch_concurrency or self.pool_maxsize
 
         self._pool: Optional[aiomysql.Pool] = None
 
@@ -105,19 +109,16 @@ class MySQLClient(BaseDBAsyncClient):
             **self.extra,
         }
 
+        if self.storage_engine:
+            # Session variable, so it has to be set on every pooled connection
+            pool_template.setdefault(
+                "init_command", f"SET default_storage_engine='{self.storage_engine}'"
+            )
+            if self.storage_engine.lower() != "innodb":  # pragma: nobranch
+                self.capabilities.__dict__["supports_transactions"] = False
+
         try:
             self._pool = await aiomysql.create_pool(password=self.password, **pool_template)
-
-            if isinstance(self._pool, aiomysql.Pool):
-                async with self.acquire_connection() as connection:
-                    async with connection.cursor() as cursor:
-                        if self.storage_engine:
-                            await cursor.execute(
-                                f"SET default_storage_engine='{self.storage_engine}';"
-                            )
-                            if self.storage_engine.lower() != "innodb":  # pragma: nobranch
-                                self.capabilities.__dict__["supports_transactions"] = False
-
             self.log.debug("Created connection %s pool with params: %s", self._pool, pool_template)
 
         except pymysql.err.OperationalError:
@@ -190,7 +191,7 @@ class MySQLClient(BaseDBAsyncClient):
             async with connection.cursor() as cursor:
                 await cursor.execute(query, values)
                 rows = await cursor.fetchall()
-                return cursor.rowcount, [f.name for f in cursor._result.fields] if rows else [], rows
+                return cursor.rowcount, [d[0] for d in cursor.description] if rows else [], rows
 
     @translate_mysql_exceptions
     async def execute_script(self, query: str) -> None:
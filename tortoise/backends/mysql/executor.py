@@ -7,6 +7,8 @@ from tortoise.models import Model
 
 
 class MySQLExecutor(BaseExecutor):
+    __slots__ = ()
+
     EXPLAIN_PREFIX = "EXPLAIN FORMAT=JSON"
 
     def parameter(self, pos: int) -> Parameter:
@@ -49,7 +49,7 @@ class MySQLSchemaGenerator(BaseSchemaGenerator):
                 exists="IF NOT EXISTS " if safe else "",
                 index_name=self._generate_index_name("idx", model, column_names),
                 table_name=model._meta.db_table,
-                columns=", ".join([self.quote(f) for f in column_names]),
+                columns=", ".join(map(self.quote, column_names)),
             )
         )
         return ""
@@ -41,7 +41,9 @@ translate_sqlite_exceptions = translate_exceptions(_sqlite3_exc_map)
 class SqliteClient(BaseDBAsyncClient):
     executor_class = SqliteExecutor
     schema_generator = SqliteSchemaGenerator
-    capabilities = Capabilities("sqlite", daemon=False, requires_limit=True, inline_comment=True)
+    capabilities = Capabilities(
+        "sqlite", daemon=False, requires_limit=True, inline_comment=True, max_params=999
+    )
 
     def __init__(self, file_path: str, **kwargs) -> None:
         super().__init__(**kwargs)
@@ -49,6 +51,7 @@ class SqliteClient(BaseDBAsyncClient):
 
         self.pragmas = kwargs.copy()
         self.pragmas.pop("connection_name", None)
+        self.pragmas.pop("max_prefetch_concurrency", None)
         self.pragmas.setdefault("journal_mode", "WAL")
         self.pragmas.setdefault("journal_size_limit", 16384)
         self.pragmas.setdefault("foreign_keys", "ON")
@@ -72,9 +75,11 @@ class SqliteClient(BaseDBAsyncClient):
         self._connection = await aiosqlite.connect(self.filename, isolation_level=None)
         self._connection._conn.row_factory = sqlite3.Row
 
-        for pragma, val in self.pragmas.items():
-            cursor = await self._connection.execute(f"PRAGMA {pragma}={val}")
-            await cursor.close()
+        # All pragmas go to the worker thread in one script instead of one hop each
+        cursor = await self._connection.executescript(
+            "".join([f"PRAGMA {pragma}={val};" for pragma, val in self.pragmas.items()])
+        )
+        await cursor.close()
 
         self.log.debug(
             "Created connection %s with params: filename=%s %s",
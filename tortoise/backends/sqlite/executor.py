@@ -7,6 +7,8 @@ from tortoise.models import Model
 
 
 class SqliteExecutor(BaseExecutor):
+    __slots__ = ()
+
     EXPLAIN_PREFIX = "EXPLAIN QUERY PLAN"
 
     def parameter(self, pos: int) -> Parameter:
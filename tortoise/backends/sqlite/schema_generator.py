@@ -1,4 +1,14 @@
-from tortoise.backends.base.schema_generator import BaseSchemaGenerator
+from tortoise.backends.base.schema_generator import BaseSchemaGenerator, compile_escape_pattern
+
+ESCAPE_TRANSLATION_TABLE = str.maketrans({
+    "\0": "\\0",
+    "\\": "\\\\",
+    "\n": "\\n",
+    "\r": "\\r",
+    "\032": "\\Z",
+    "/": "\\/",
+})
+ESCAPE_PATTERN = compile_escape_pattern(ESCAPE_TRANSLATION_TABLE)
 
 
 class SqliteSchemaGenerator(BaseSchemaGenerator):
@@ -7,14 +17,9 @@ class SqliteSchemaGenerator(BaseSchemaGenerator):
         # This method provides a default method to escape comment strings as per
         # default standard as applied under mysql like database. This can be
         # overwritten if required to match the database specific escaping.
-        _escape_table = [chr(x) for x in range(128)]
-        _escape_table[0] = "\\0"
-        _escape_table[ord("\\")] = "\\\\"
-        _escape_table[ord("\n")] = "\\n"
-        _escape_table[ord("\r")] = "\\r"
-        _escape_table[ord("\032")] = "\\Z"
-        _escape_table[ord("/")] = "\\/"
-        return comment.translate(_escape_table)
+        if not ESCAPE_PATTERN.search(comment):
+            return comment
+        return comment.translate(ESCAPE_TRANSLATION_TABLE)
 
     def _table_comment_generator(self, table: str, comment: str) -> str:
         return f" /* {self._escape_comment(comment)} */"
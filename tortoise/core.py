@@ -12,6 +12,7 @@ from typing import Dict, List, Optional, Type, Any, Union
 
 from tortoise.backends.base.client import BaseDBAsyncClient
 from tortoise.backends.base.config_generator import expand_db_url, generate_config, obscure_password
+from tortoise.backends.base.executor import EXECUTOR_CACHE
 from tortoise.exceptions import ConfigurationError, ParamsError
 from tortoise.fields.relational import RelationField, ManyToManyField
 from tortoise.models import Model
@@ -336,6 +337,8 @@ class _Tortoise:
                 for model in models_map.values():
                     model._meta.connection_name = None
 
+        # Plans refer to the model classes and their relations, which init may replace
+        EXECUTOR_CACHE.clear()
         self._app_models_map = {}
         self._current_transaction_map = {}
         self._db_client_map = {}
@@ -1,10 +1,11 @@
 
+import sys
 from collections import defaultdict
 from copy import deepcopy
 from dataclasses import dataclass
 from functools import partial
 from typing import (
-    Any, Awaitable, Dict, Generic, List, Literal, Optional, Tuple, Type, TypeVar, Union, TYPE_CHECKING
+    Any, Awaitable, Dict, Generic, List, Literal, Optional, Type, TypeVar, Union, TYPE_CHECKING
 )
 
 from pypika import Criterion, Table, Field as PyPikaField
@@ -394,23 +395,17 @@ class BackwardFKField(RelationField):
         return BackwardFKFilter(self, opr, value_encoder)
 
     async def prefetch(self, instance_list: list, related_query: "QuerySet[MODEL]") -> list:
-        instance_id_set: set = {
-            instance._meta.pk.db_value(instance.pk, instance)
-            for instance in instance_list
-        }
+        # The __in filter converts the pks to db values itself
+        instance_id_set: set = {instance.pk for instance in instance_list}
         related_name = self.related_name
 
         related_object_list = await related_query.filter(
             **{f"{related_name}__in": list(instance_id_set)}
         )
 
-        related_object_map: Dict[str, list] = {}
+        related_object_map: Dict[Any, list] = defaultdict(list)
         for entry in related_object_list:
-            object_id = getattr(entry, related_name)
-            if object_id in related_object_map.keys():
-                related_object_map[object_id].append(entry)
-            else:
-                related_object_map[object_id] = [entry]
+            related_object_map[getattr(entry, related_name)].append(entry)
 
         for instance in instance_list:
             relation_container = getattr(instance, self.model_field_name)
@@ -547,7 +542,9 @@ class ForeignKey(RelationField):
     def create_relation(self, tortoise) -> None:
         remote_model = tortoise.get_model(self.remote_model, self.model)
 
-        self.id_field_name = f"{self.model_field_name}_id"
+        # Interned like the other field names, which come from identifiers,
+        # as it is used as attribute, fields_map and db column name on every row
+        self.id_field_name = sys.intern(f"{self.model_field_name}_id")
 
         id_field_object = deepcopy(remote_model._meta.pk)
         id_field_object.primary_key = self.primary_key
@@ -627,10 +624,8 @@ class BackwardOneToOneField(BackwardFKField):
         )
 
     async def prefetch(self, instance_list: list, related_query: "QuerySet[MODEL]") -> list:
-        instance_id_set: set = {
-            instance._meta.pk.db_value(instance.pk, instance)
-            for instance in instance_list
-        }
+        # The __in filter converts the pks to db values itself
+        instance_id_set: set = {instance.pk for instance in instance_list}
         related_name = self.related_name
 
         related_object_list = await related_query.filter(
@@ -916,27 +911,26 @@ class ManyToManyField(RelationField):
         #
 
         _, db_columns, raw_results = await self.model._meta.db.execute_query(context.query.get_sql())
-        relations: List[Tuple[Any, MODEL]] = []
+        pk_to_python_value = self.model._meta.pk.to_python_value
+        related_instances: List[MODEL] = []
+        relation_map: Dict[Any, List[MODEL]] = defaultdict(list)
         for row in raw_results:
             row_iter = iter(zip(db_columns, row))
             related_instance = related_query.model._init_from_db_row(row_iter, related_query._select_related)
+            related_instances.append(related_instance)
 
             db_column, value = next(row_iter)  # row[field_object.backward_key]
-            backward_key = self.model._meta.pk.to_python_value(value)
-            relations.append((backward_key, related_instance))
-
-        related_executor = self.model._meta.db.executor_class(
-            model=related_query.model,
-            db=self.model._meta.db,
-            prefetch_map=related_query._prefetch_map,
-            prefetch_queries=related_query._prefetch_queries,
-        )
-
-        await related_executor._execute_prefetch_queries([item for _, item in relations])
+            relation_map[pk_to_python_value(value)].append(related_instance)
+
+        if related_query._prefetch_map or related_query._prefetch_queries:
+            related_executor = self.model._meta.db.executor_class(
+                model=related_query.model,
+                db=self.model._meta.db,
+                prefetch_map=related_query._prefetch_map,
+                prefetch_queries=related_query._prefetch_queries,
+            )
 
-        relation_map: Dict[Any, List[MODEL]] = {}
-        for k, item in relations:
-            relation_map.setdefault(k, []).append(item)
+            await related_executor._execute_prefetch_queries(related_instances)
 
         for instance in instance_list:
             relation_container = getattr(instance, self.model_field_name)
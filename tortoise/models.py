@@ -6,7 +6,7 @@ from typing import Any, Dict, Generator, List, Optional, Set, Tuple, Type, TypeV
 from pypika import Order, Table
 
 from tortoise.constants import LOOKUP_SEP
-from tortoise.exceptions import ConfigurationError, OperationalError, UnknownFieldError
+from tortoise.exceptions import ConfigurationError, OperationalError, ParamsError, UnknownFieldError
 from tortoise.fields.base import Field
 from tortoise.fields.data import IntegerField
 from tortoise.fields.relational import (
@@ -496,7 +496,10 @@ class Model(metaclass=ModelMeta):
 
     @classmethod
     async def bulk_create(
-        cls: Type[MODEL], objects: Iterable[MODEL], using_db: Optional["BaseDBAsyncClient"] = None
+        cls: Type[MODEL],
+        objects: Iterable[MODEL],
+        using_db: Optional["BaseDBAsyncClient"] = None,
+        batch_size: Optional[int] = None,
     ) -> None:
         """
         Bulk insert operation:
@@ -520,10 +523,18 @@ class Model(metaclass=ModelMeta):
 
         :param using_db:
         :param objects: Iterable of objects to bulk create
+        :param batch_size: Maximum number of objects inserted per statement,
+            on top of the backend parameter limit
+        :raises ParamsError: If batch_size is not a positive integer
 
         """
+        if batch_size is not None and batch_size < 1:
+            raise ParamsError("batch_size must be a positive integer")
+
         db = using_db or cls._meta.db
-        await db.executor_class(model=cls, db=db).execute_bulk_insert(objects)  # type: ignore
+        await db.executor_class(model=cls, db=db).execute_bulk_insert(  # type: ignore
+            objects, batch_size
+        )
 
     @classmethod
     async def bulk_update(
@@ -56,8 +56,10 @@ class AwaitableStatement(Generic[MODEL]):
         queryset._db = self._db
         queryset.capabilities = self.capabilities
         queryset.model = self.model
-        queryset.q_objects = deepcopy(self.q_objects)
-        queryset.annotations = deepcopy(self.annotations)
+        # Unfiltered, unannotated querysets are cloned on every prefetch and related fetch,
+        # so their empty containers are created directly instead of through deepcopy
+        queryset.q_objects = deepcopy(self.q_objects) if self.q_objects else []
+        queryset.annotations = deepcopy(self.annotations) if self.annotations else {}
 
     def _clone(self: STATEMENT) -> STATEMENT:
         queryset = self.__class__.__new__(self.__class__)